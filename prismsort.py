@@ -22,8 +22,8 @@ Usage:  %(interpreter)s %(scriptfile)s inputfile [options]
 -H, --horizontal    : processes the image horizontally (same as -a 90)
 -i, --intensity=NUM : intensity (recommended: -2~2; default: 0)
                       will not go lower than (3 - number of blocks)
--I, --interpol=NUM  : rotation interpolation (default: 0 = bicubic, sharp)
-                      (1 = bilinear, smooth; 2 = nearest, aliased)
+-I, --interpol=NUM  : ignored, kept for compatibility
+                      (rotations no longer resample the picture)
 -J, --jpeg=NUM      : saves as JPEG at the specified quality
                       (recommended: 75~95)
 -n, --numoutput=NUM : number of output files to be generated (default: 1)
@@ -53,9 +53,9 @@ Usage:  %(interpreter)s %(scriptfile)s inputfile [options]
 
 
 from __future__ import print_function  # prevent Python 2 crash, unsupported!
-from random import random, randrange
 from math import sqrt, radians as rad, cos, sin
 from platform import system
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import getopt
 import subprocess
@@ -73,34 +73,56 @@ except AssertionError:
     sys.exit(69)
 
 try:
-    # check for prerequisites: Python 3.x, the Pillow module,
-    # and its dependencies ($ pip3 install Pillow)
+    # check for prerequisites: Python 3.x, the Pillow and NumPy modules,
+    # and their dependencies ($ pip3 install Pillow numpy)
     # http://pillow.readthedocs.org/en/3.1.x/installation.html
-    from PIL import Image, ImageOps
+    from PIL import Image
+    import numpy as np
 except ImportError:
-    # try to install Pillow automatically
-    print("\nThis Python 3 script requires the "+BOLD+"Pillow"+NORM+" module "
-          "and its dependencies.\nPlease wait...", end="")
+    # try to install Pillow and NumPy automatically
+    print("\nThis Python 3 script requires the "+BOLD+"Pillow"+NORM+" and " +
+          BOLD+"NumPy"+NORM+" modules and their dependencies."
+          "\nPlease wait...", end="")
     try:
         # install is the output of the command in bytes
-        install = subprocess.Popen(["pip3", "install", "Pillow"],
+        install = subprocess.Popen(["pip3", "install", "Pillow", "numpy"],
                                    stdout=subprocess.PIPE,
                                    stderr=subprocess.PIPE).communicate()[0]
     except FileNotFoundError as e:  # if pip3 is not in PATH
         install = bytes(str(e), "ascii")
     if b'Successfully installed' in install:
-        print("\r"+BOLD+"Pillow was automatically installed."+NORM,
+        print("\r"+BOLD+"Pillow and NumPy were automatically installed."+NORM,
               "\nPlease try running the script again.\n")
     else:  # manual instructions
-        print("\r"+BOLD+"You need to install Pillow manually."+NORM)
-        print("Try the command: "+BOLD, "pip3 install Pillow"+NORM)
+        print("\r"+BOLD+"You need to install Pillow and NumPy manually."+NORM)
+        print("Try the command: "+BOLD, "pip3 install Pillow numpy"+NORM)
         print("or visit"+BOLD,
               "http://pillow.readthedocs.org/en/3.1.x/installation.html"
               "\n"+NORM)
     sys.exit(69)
 
+try:
+    # optional: compiles the glitch kernel to machine code ($ pip3 install
+    # numba), otherwise the exact same functions run as plain Python
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand in for numba.njit, leaving the decorated function as is."""
+        return lambda function: function
+
 
 # default parameters
+# Pillow's raw mode matching native 0xRRGGBB integers (with a zero byte)
+PACKING = 'BGRX' if sys.byteorder == 'little' else 'XRGB'
+CHANNELS = np.array([0xFF0000, 0x00FF00, 0x0000FF], np.uint32)  # R, G, B
+# the ways a line can be partially sorted, with their odds:
+# (starts at the lower bound, stops at the upper bound, descending order)
+SORTS = np.array([(True, True, False),  # middle
+                  (False, True, False),  # beginning
+                  (True, True, True),  # middle, reversed
+                  (True, False, True)])  # end, reversed
+SORT_ODDS = (0.475, 0.025, 0.475, 0.025)
+SOURCE = None  # the opened (and resized) image, initialized later
 IMAGE_WIDTH, IMAGE_HEIGHT = None, None  # will be initialized later
 RESIZE_FACT = 1  # each dimension will be resized by sqrt(RESIZE_FACT)
 BLOCKS = 9  # size of a block is each dimension of the picture divided by this
@@ -110,9 +132,10 @@ INTENSITY = 0  # tweaks the probability of line corruption
 ROTATION = 0  # defaults to vertical
 JPEG = None  # save as .jpg if 0 < JPEG < 100
 FUZZY_EDGES = False  # if True, don't crop the output as much
-INTERPOLATION = 0  # for rotation; 0 = bicubic, 1 = bilinear, 2 = nearest
 BELL = ''  # silent by default
 L = []  # empty list
+DOTS = None  # number of dots currently displayed by progress()
+RNG = np.random.default_rng()  # source of all the glitch's randomness
 
 
 def printHelp():
@@ -139,7 +162,8 @@ def openImage(file, resize=1):
               "syntax.")
         sys.exit(66)
     # because don't want to manipulate JPEGs directly:
-    image = image.convert('RGB')
+    if image.mode != 'RGB':  # no need to copy pixels that already are
+        image = image.convert('RGB')
     if resize != 1:  # makes image smaller for speed
         image = image.resize((int(image.size[0]/sqrt(resize)),
                               int(image.size[1]/sqrt(resize))),
@@ -148,39 +172,21 @@ def openImage(file, resize=1):
     return image, width, height
 
 
-def probability(p):
-    """Determine if a certain event occurs.
+@njit("void(uint32[::1], int64, int64, boolean)", cache=True)
+def partialSort(line, lo, hi, reverse):
+    """Sort part of a line of pixels, in place.
 
     Args:
-        p (float):  the probability of that event
-    Returns:
-        bool.
+        line (ndarray):  the line's pixels, packed as 0xRRGGBB integers
+        lo (int):  lower bound of the part to sort
+        hi (int):  upper bound of the part to sort
+        reverse (bool):  whether to sort in descending order
     """
-    return True if random() < p else False
-
-
-def partialSort(numList):
-    """Sort a list partially and randomly.
-
-    Args:
-        numList (list):  the list to sort
-    Returns:
-        list:  the partially sorted list
-    """
-    ls = list(numList)
-    a = randrange(len(ls) - 1)  # lower bound
-    b = randrange(a + 1, len(ls))  # upper bound
-    if probability(0.5):
-        if probability(0.95):
-            ls = ls[0:a] + sorted(ls[a:b]) + ls[b:]  # middle
-        else:
-            ls = sorted(ls[0:b]) + ls[b:]  # beginning
-    else:
-        if probability(0.95):
-            ls = ls[0:a] + list(reversed(sorted(ls[a:b]))) + ls[b:]  # middle
-        else:
-            ls = ls[0:a] + list(reversed(sorted(ls[a:])))  # end
-    return ls
+    # packed pixels sort in the same order as their (R, G, B) tuples would
+    segment = line[lo:hi]
+    segment.sort()
+    if reverse:
+        segment[:] = segment[::-1].copy()
 
 
 def progress(counter=0, total=None, done=False):
@@ -191,73 +197,155 @@ def progress(counter=0, total=None, done=False):
         total (int):  the maximum number of iterations (default: None)
         done (bool):  whether a task is done or not (default: False)
     """
+    global DOTS
     if done:
+        DOTS = None
         print('.' * 10, "Done!", end="")
         print("" if not L
               else " \U0001F60A\x1B[0m"
               if system() == "\x44\x61\x72\x77\x69\x6E"
               else " \x3A\x29\x1B[0m")
     elif total is not None:
+        DOTS = None
         print("" if not L else "\x1B["+str(31+(counter-1) % 6)+";1m", end="")
         print(counter, "/", total)  # fraction
     else:
         out = int((counter/2)/(IMAGE_WIDTH if IMAGE_WIDTH >= IMAGE_HEIGHT
                                else IMAGE_HEIGHT) * 10)
-        print(out * '.' + (10 - out) * ' ', end="\r")  # animated dots
+        if out != DOTS:  # only redraw when there is a new dot to show
+            DOTS = out
+            print(out * '.' + (10 - out) * ' ', end="\r", flush=True)
+
+
+@njit("void(uint32[:, ::1], int64, int64, int64, int64, int64, boolean, "
+      "int64, boolean[:])", cache=True)
+def _glitchLine(arr, y, startW, endW, lo, hi, reverse, colour, shifted):
+    """Glitch one line of a region of an image, in place.
 
+    Args:
+        arr (ndarray):  the image's pixels, line by line, as a
+                        (width, height) array of 0xRRGGBB integers
+        y (int):  the line's H-coordinate
+        startW (int):  starting W-coordinate of the region
+        endW (int): ending W-coordinate of the region
+        lo (int):  lower bound of the part of the line to sort
+        hi (int):  upper bound of the part of the line to sort
+        reverse (bool): whether to sort that part in descending order
+        colour (int): the original channel to restore (-1 for none)
+        shifted (ndarray): which pixels land one column further
+    """
+    # every pixel on the line, clipped to the picture
+    line = arr[y, startW:endW].copy()
+    # backup of the line before sort, to unglitch a channel later
+    originalLine = line.copy()
+    partialSort(line, lo, hi, reverse)
+    # restore one of the original channels (looks colourful) by merging
+    # the bits of that channel back in, for all the pixels at once
+    if colour >= 0:  # 0 = R, 1 = G, 2 = B
+        line ^= (line ^ originalLine) & CHANNELS[colour]
+    # make the actual changes to the image array
+    if y + 1 >= len(arr):  # out of bounds of the picture
+        return
+    for x in np.nonzero(shifted)[0]:  # only when dithering
+        if y + 2 < len(arr):
+            arr[y + 2, startW + x] = line[x]
+        line[x] = arr[y + 1, startW + x]  # leaves that pixel untouched
+    arr[y + 1, startW:startW + len(line)] = line
+
+
+@njit("void(uint32[:, ::1], int64, int64, int64, boolean[:], int64[:], "
+      "int64[:], boolean[:], int64[:], boolean[:, :])", nogil=True, cache=True)
+def _glitchBlock(arr, startW, startH, endW,
+                 glitched, lo, hi, reverse, colours, shifted):
+    """Glitch every line of a region of an image, in place.
 
-def pixSort(image, startW=0, startH=0,
+    Args:
+        arr (ndarray):  the image's pixels, line by line, as a
+                        (width, height) array of 0xRRGGBB integers
+        startW (int):  starting W-coordinate of the region
+        startH (int):  starting H-coordinate of the region
+        endW (int): ending W-coordinate of the region
+        glitched (ndarray): which lines are glitched
+        lo, hi, reverse, colours, shifted (ndarray): for each line, the
+            matching argument of _glitchLine
+    """
+    for i in range(len(glitched)):  # for each line of the pic
+        if glitched[i]:
+            _glitchLine(arr, startH + i, startW, endW,
+                        lo[i], hi[i], reverse[i], colours[i], shifted[i])
+
+
+def pixSort(arr, startW=0, startH=0,
             endW=IMAGE_WIDTH, endH=IMAGE_HEIGHT, p=0.8):
     """Glitch a region of an image using a purposefully broken pixel sort.
 
     Args:
-        image (Image):  an Image object
+        arr (ndarray):  the image's pixels, line by line, as a
+                        (width, height) array of 0xRRGGBB integers
         startW (int):  starting W-coordinate of the region (default: 0)
         startH (int):  starting H-coordinate of the region (default: 0)
         endW (int): ending W-coordinate of the region (default: IMAGE_WIDTH)
         endH (int): ending H-coordinate of the region (default: IMAGE_HEIGHT)
         p (float): the probability of a line being glitched (default: 0.8)
     Returns:
-        Image: the glitched Image object
+        ndarray: the glitched array, modified in place
     """
-    for y in range(startH, endH):  # for each line of the pic
-        progress(y)
-        if probability(p):
-            line = []
-            for x in range(startW, endW):
-                try:
-                    # make list of every pixel RGB value on the line as tuple
-                    line.append(image.getpixel((y, x)))
-                except IndexError:  # if out of bounds of the picture
-                    break
-            # backup of the line before sort, to unglitch a channel later
-            originalLine = list(line)
-            # if we broke out of the previous loop we might get out of bounds
-            try:
-                line = partialSort(line)
-            except ValueError:
-                pass  # My code is bad, and I should feel bad.
-            # restore one of the original channels at random (looks colourful)
-            if probability(p * 0.75):
-                colour = randrange(3)  # 0 = R, 1 = G, 2 = B
-                for px in range(len(line)):
-                    line[px] = ((originalLine[px][0]
-                                 if colour == 0 else line[px][0]),
-                                (originalLine[px][1]
-                                 if colour == 1 else line[px][1]),
-                                (originalLine[px][2]
-                                 if colour == 2 else line[px][2]))
-            # make the actual changes to the image object
-            for x in range(len(line)):
-                try:
-                    image.putpixel((y + (randrange(1, 3)
-                                         if probability(0.1) and DITHER
-                                         else 1),
-                                    startW + x),
-                                   (line[x]))
-                except IndexError:  # out of bounds of the picture
-                    break
-    return image
+    # the region, clipped to the bounds of the picture
+    endH, endW = min(endH, len(arr)), min(endW, arr.shape[1])
+    lines, length = endH - startH, endW - startW
+    if lines <= 0 or length <= 0:
+        return arr
+    # all the randomness for the region is drawn at once
+    glitched = RNG.random(lines) < p
+    if length > 1:  # shorter lines can't be partially sorted
+        a = RNG.integers(0, length - 1, lines)  # lower bounds
+        b = RNG.integers(a + 1, length)  # upper bounds
+    else:
+        a = b = np.zeros(lines, np.int64)
+    sorts = SORTS[RNG.choice(len(SORTS), lines, p=SORT_ODDS)]
+    lo = np.where(sorts[:, 0], a, 0)
+    hi = np.where(sorts[:, 1], b, length)
+    reverse = sorts[:, 2]
+    colours = np.where(RNG.random(lines) < p * 0.75,
+                       RNG.integers(0, 3, lines), -1)
+    shifted = (RNG.random((lines, length)) < 0.05 if DITHER
+               else np.zeros((lines, 0), np.bool_))
+    _glitchBlock(arr, startW, startH, endW,
+                 glitched, lo, hi, reverse, colours, shifted)
+    return arr
+
+
+def lineIndices(size, angle):
+    """Walk the lines of a picture at an angle.
+
+    Every pixel of the picture belongs to exactly one line, so gathering
+    the lines and scattering them back leaves the picture unchanged.
+
+    Args:
+        size (tuple):  the (width, height) of the picture
+        angle (float):  an angle of rotation, counterclockwise
+    Returns:
+        ndarray:  for each line, the line-major flat index of every pixel
+                  along it (or width * height past the edge of the picture)
+    """
+    width, height = size
+    c, s = cos(rad(angle)), sin(rad(angle))
+    # the lines go along (-s, c) and follow each other along (c, s).
+    # They are walked one row at a time if they are closer to vertical,
+    # or one column at a time if they are closer to horizontal.
+    if abs(c) >= abs(s):
+        steps, crossing, slope = height, width, -s / c
+        forward, rightward, strides = c > 0, c > 0, (1, height)
+    else:
+        steps, crossing, slope = width, height, c / -s
+        forward, rightward, strides = s < 0, s > 0, (height, 1)
+    along = np.arange(steps) if forward else np.arange(steps)[::-1]
+    shifts = np.rint(along * slope).astype(np.intp)
+    starts = np.arange(-shifts.max(), crossing - shifts.min())
+    across = (starts if rightward else starts[::-1])[:, None] + shifts
+    inside = (across >= 0) & (across < crossing)
+    return np.where(inside, along * strides[0] + across * strides[1],
+                    width * height)
 
 
 def glitch(image, blocks=9, rotation=0):
@@ -273,109 +361,131 @@ def glitch(image, blocks=9, rotation=0):
     # the script works with overlapping rectangles of the following size:
     wBlock, hBlock = int(IMAGE_WIDTH/blocks), int(IMAGE_HEIGHT/blocks)
 
-    # rotate the picture
+    # the pixels, line by line (a line being a column of the picture), so
+    # that each line is contiguous in memory and every block is a compact,
+    # cache-friendly stack of lines. Each pixel is packed into a single
+    # 0xRRGGBB integer (by Pillow, in one pass), and a black border is
+    # added around them.
+    pixels = np.frombuffer(image.tobytes('raw', PACKING), np.uint32)
+    border = wBlock if wBlock >= hBlock else hBlock
+    arr = np.zeros((image.width + border * 2, image.height + border * 2),
+                   np.uint32)
+    arr[border:border + image.width,
+        border:border + image.height] = pixels.reshape(image.height,
+                                                       image.width).T
+    # rather than rotating the picture, its lines are walked at an angle
+    # and gathered side by side. Pixels are moved, never resampled.
     if rotation != 0:
-        image = image.rotate(rotation,
-                             resample=(Image.BILINEAR
-                                       if INTERPOLATION == 1
-                                       else Image.NEAREST
-                                       if INTERPOLATION == 2
-                                       else Image.BICUBIC),
-                             expand=True)
-    if rotation == 0 or abs(rotation) == 90:  # adds a black border
-        image = ImageOps.expand(image,
-                                border=(wBlock if wBlock >= hBlock
-                                        else hBlock),
-                                fill=0)
-
-    # glitch loop
-    currentHeight = 0
-    # the loops continue a bit outside the original image's bounds
-    # in order to produce the distinctive "fuzzy edges" look,
-    # hence the lengthy conditionals.
-    while (currentHeight + hBlock * 2/3 <=
-           (IMAGE_HEIGHT if IMAGE_HEIGHT >= IMAGE_WIDTH
-            else IMAGE_WIDTH)*2):
-        currentWidth = 0
-        while (currentWidth + wBlock * 2/3 <=
-               (IMAGE_WIDTH if IMAGE_WIDTH >= IMAGE_HEIGHT
-                else IMAGE_HEIGHT)*2):
-            image = pixSort(image,
-                            currentHeight,
-                            currentWidth,
-                            currentHeight + hBlock,
-                            currentWidth + wBlock,
-                            # I pulled the following formula out of my a**,
-                            # but empirically it seemed to yield the best
-                            # p values for blocks between 5 and 11.
-                            p=(1 - (blocks**2 / (blocks + 1)**2) **
-                               randrange(blocks - 4 + INTENSITY,
-                                         blocks - 1 + INTENSITY)))
-            currentWidth += int(wBlock * 2/3) if blocks > 1 else wBlock
-        currentHeight += int(hBlock * 2/3) if blocks > 1 else hBlock
-
-    # undo the rotation
+        frame = arr
+        lines = lineIndices(frame.shape, rotation)
+        # one extra black pixel at the end stands in for everything outside
+        pixels = np.append(frame, np.zeros(1, frame.dtype))
+        arr = pixels[lines]
+
+    # glitch loop, working directly on the pixels as an array rather than
+    # going through Pillow for every single pixel. The blocks cover the
+    # whole array, black border included, in order to produce the
+    # distinctive "fuzzy edges" look.
+    numLines, lineLength = arr.shape
+    # progress() counts its dots up to twice the largest dimension
+    reach = (IMAGE_WIDTH if IMAGE_WIDTH >= IMAGE_HEIGHT else IMAGE_HEIGHT) * 2
+    # the possible probabilities of a line being glitched in a block.
+    # I pulled the following formula out of my a**, but empirically
+    # it seemed to yield the best p values for blocks between 5 and 11.
+    odds = 1 - (blocks**2 / (blocks + 1)**2) ** np.arange(
+        blocks - 4 + INTENSITY, blocks - 1 + INTENSITY)
+    # rather than going over heavily overlapping blocks, the picture is
+    # glitched by a grid of blocks side by side, then by a second grid
+    # shifted by half a block, which glitches across the seams of the
+    # first one so the glitches still pile up
+    grids = [(0, 0)]
+    if blocks > 1:
+        grids.append((hBlock // 2, wBlock // 2))
+    # each line spills into the next two, so only blocks this many steps
+    # apart in a row can be glitched at once
+    phases = -(-(wBlock + 2) // wBlock)
+    with ThreadPoolExecutor() as pool:
+        for grid, (startHeight, startWidth) in enumerate(grids):
+            widths = range(startWidth, numLines, wBlock)
+            for currentHeight in range(startHeight, lineLength, hBlock):
+                progress((currentHeight + grid * lineLength) * reach /
+                         (lineLength * len(grids)))
+                for phase in range(phases):
+                    phaseWidths = widths[phase::phases]
+                    futures = [pool.submit(pixSort, arr,
+                                           currentHeight,
+                                           currentWidth,
+                                           currentHeight + hBlock,
+                                           currentWidth + wBlock,
+                                           p=p)
+                               for currentWidth, p in zip(
+                                   phaseWidths,
+                                   RNG.choice(odds, len(phaseWidths)))]
+                    for future in futures:  # wait for the whole phase
+                        future.result()
+
+    # scatter the lines back where they were taken from
     if rotation != 0:
-        image = image.rotate(-rotation,
-                             resample=(Image.BILINEAR
-                                       if INTERPOLATION == 1
-                                       else Image.NEAREST
-                                       if INTERPOLATION == 2
-                                       else Image.BICUBIC),
-                             expand=True)
+        pixels[lines] = arr
+        arr = pixels[:-1].reshape(frame.shape)
 
-    return image
+    # unpack the pixels, back to rows of (R, G, B) values
+    return Image.frombuffer('RGB', arr.shape, np.ascontiguousarray(arr.T),
+                            'raw', PACKING, 0, 1)
 
 
 def main():
     """Main loop; Open and save the picture file."""
     try:
-        iteration = 0
-        while iteration < NUM_OUTPUT:
-            progress(iteration + 1, total=NUM_OUTPUT)
-
-            # opening the file and glitching it
-            im = openImage(FILENAME, RESIZE_FACT)[0]
-            im = glitch(im, BLOCKS, ROTATION)
-
-            # cropping the image to original size, except if fuzzy edges,
-            # in which case a black border is left around the picture.
-            trig = (abs(sin(rad(ROTATION)))
-                    if abs(sin(rad(ROTATION))) > abs(cos(rad(ROTATION)))
-                    else abs(cos(rad(ROTATION))))  # for fuzzy edges
-            left = int((im.width -  # the current image width
-                        IMAGE_WIDTH -  # the original image width
-                        (0 if not FUZZY_EDGES
-                         else IMAGE_WIDTH/BLOCKS*trig))/2)  # less crop
-            top = int((im.height -
-                       IMAGE_HEIGHT -
-                       (0 if not FUZZY_EDGES
-                        else IMAGE_HEIGHT/BLOCKS*trig))/2)
-            right = int(IMAGE_WIDTH +
-                        (im.width -
-                         IMAGE_WIDTH +
-                         (0 if not FUZZY_EDGES
-                          else IMAGE_WIDTH/BLOCKS*trig))/2)
-            bottom = int(IMAGE_HEIGHT +
-                         (im.height -
-                          IMAGE_HEIGHT +
-                          (0 if not FUZZY_EDGES
-                           else IMAGE_HEIGHT/BLOCKS*trig))/2)
-            # Pillow uses (left, top, right, bottom) coordinates,
-            # which define a rectangle region to keep.
-            im = im.crop(box=(left, top, right, bottom))
-
-            # saving the output
-            if JPEG is None:
-                im.save(FILENAME.split('.')[0]+'_out'+str(iteration)+".png")
-            else:
-                im.save(FILENAME.split('.')[0]+'_out'+str(iteration)+".jpg",
+        # for fuzzy edges, the crop leaves a black border around the picture
+        trig = (abs(sin(rad(ROTATION)))
+                if abs(sin(rad(ROTATION))) > abs(cos(rad(ROTATION)))
+                else abs(cos(rad(ROTATION))))
+        fuzzyW = 0 if not FUZZY_EDGES else IMAGE_WIDTH/BLOCKS*trig
+        fuzzyH = 0 if not FUZZY_EDGES else IMAGE_HEIGHT/BLOCKS*trig
+
+        saves = []  # pending saves, which run one at a time
+        with ThreadPoolExecutor(max_workers=1) as saver:
+            iteration = 0
+            while iteration < NUM_OUTPUT:
+                progress(iteration + 1, total=NUM_OUTPUT)
+
+                # glitching the file, which is only opened once: glitch()
+                # leaves the source image untouched
+                im = glitch(SOURCE, BLOCKS, ROTATION)
+
+                # cropping the image to original size, except if fuzzy edges,
+                # in which case a black border is left around the picture.
+                left = int((im.width -  # the current image width
+                            IMAGE_WIDTH -  # the original image width
+                            fuzzyW)/2)  # less crop
+                top = int((im.height - IMAGE_HEIGHT - fuzzyH)/2)
+                right = int(IMAGE_WIDTH +
+                            (im.width - IMAGE_WIDTH + fuzzyW)/2)
+                bottom = int(IMAGE_HEIGHT +
+                             (im.height - IMAGE_HEIGHT + fuzzyH)/2)
+                # Pillow uses (left, top, right, bottom) coordinates,
+                # which define a rectangle region to keep.
+                im = im.crop(box=(left, top, right, bottom))
+
+                # saving the output in the background, while the next one
+                # is being glitched
+                if JPEG is None:
+                    saves.append(saver.submit(
+                        im.save,
+                        FILENAME.split('.')[0]+'_out'+str(iteration)+".png"))
+                else:
+                    saves.append(saver.submit(
+                        im.save,
+                        FILENAME.split('.')[0]+'_out'+str(iteration)+".jpg",
                         optimize=True,
                         quality=JPEG,
-                        subsampling=0)  # see Pillow doc for jpeg options
+                        subsampling=0))  # see Pillow doc for jpeg options
 
-            iteration += 1
-            progress(done=True)
+                iteration += 1
+                progress(done=True)
+        for save in saves:  # report any error that happened while saving
+            save.result()
         print(BELL)  # blank line if silent
 
     except KeyboardInterrupt:
@@ -429,13 +539,13 @@ if __name__ == "__main__":
                 ROTATION = int(arg)
             elif opt in ('-f', '--fuzzyedges'):  # leaves a black frame
                 FUZZY_EDGES = True
-            elif opt in ('-I', '--interpol'):  # resizing always uses Lanczos!
-                INTERPOLATION = int(arg)
+            elif opt in ('-I', '--interpol'):  # rotations don't resample
+                pass
             elif opt in ('-s', '--sound'):  # ding!
                 BELL = '\a'
         except ValueError:
             printHelp()
     # failsafe for intensity, otherwise yields poor results
     INTENSITY = INTENSITY if BLOCKS + INTENSITY >= 3 else 3 - BLOCKS
-    IMAGE_WIDTH, IMAGE_HEIGHT = openImage(FILENAME, RESIZE_FACT)[1:]
+    SOURCE, IMAGE_WIDTH, IMAGE_HEIGHT = openImage(FILENAME, RESIZE_FACT)
     main()